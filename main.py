@@ -1,5 +1,13 @@
+import sys
 from abc import ABC, abstractmethod
 
+_HELP_TEXT = (
+    "Доступні команди:\n"
+    "1. add - Додати контакт\n"
+    "2. list - Показати контакти\n"
+    "3. exit - Вихід з програми\n"
+)
+
 class UserView(ABC):
     @abstractmethod
     def display_contacts(self, contacts):
@@ -12,14 +20,14 @@ class UserView(ABC):
 class ConsoleUserView(UserView):
     def display_contacts(self, contacts):
         print("Список контактів:")
-        for contact in contacts:
-            print(f"Ім'я: {contact['name']}, Телефон: {contact['phone']}")
+        if contacts:
+            print("\n".join([
+                f"Ім'я: {contact['name']}, Телефон: {contact['phone']}"
+                for contact in contacts
+            ]))
     
     def display_help(self):
-        print("Доступні команди:")
-        print("1. add - Додати контакт")
-        print("2. list - Показати контакти")
-        print("3. exit - Вихід з програми")
+        sys.stdout.write(_HELP_TEXT)
 
 if __name__ == "__main__":
     contacts = [